@@ -5,7 +5,9 @@ Drop this file into your repo and run: streamlit run app.py
 """
 
 import ast
+import collections
 import operator as op
+import pandas as pd
 import streamlit as st
 from datetime import datetime
 import json
@@ -24,49 +26,132 @@ ALLOWED_OPERATORS = {
     # (No bitwise ops)
 }
 
+def _fold(node):
+    """
+    Collapse constant subtrees bottom-up: a BinOp/UnaryOp whose children are
+    all numeric constants is evaluated once here, so the cached tree carries
+    the result instead of being re-walked on every evaluation. Anything that
+    fails (e.g. division by zero) is left in place to error at eval time.
+    """
+    if isinstance(node, ast.BinOp):
+        node.left = _fold(node.left)
+        node.right = _fold(node.right)
+        op_func = ALLOWED_OPERATORS.get(type(node.op))
+        if (op_func is not None
+                and isinstance(node.left, ast.Constant)
+                and isinstance(node.right, ast.Constant)
+                and isinstance(node.left.value, (int, float))
+                and isinstance(node.right.value, (int, float))):
+            try:
+                return ast.copy_location(
+                    ast.Constant(op_func(node.left.value, node.right.value)), node)
+            except ArithmeticError:
+                pass
+    elif isinstance(node, ast.UnaryOp):
+        node.operand = _fold(node.operand)
+        op_func = ALLOWED_OPERATORS.get(type(node.op))
+        if (op_func is not None
+                and isinstance(node.operand, ast.Constant)
+                and isinstance(node.operand.value, (int, float))):
+            return ast.copy_location(ast.Constant(op_func(node.operand.value)), node)
+    return node
+
+# st.cache_data (rather than functools.lru_cache) so the cache survives
+# Streamlit's rerun-everything model: the script is re-executed on every
+# button press, which would rebuild a plain lru_cache from scratch.
+@st.cache_data(max_entries=256, show_spinner=False)
+def _parse(expr: str) -> ast.Expression:
+    """Parse an expression once, fold constants, and reuse the tree across reruns."""
+    tree = ast.parse(expr, mode='eval')
+    tree.body = _fold(tree.body)
+    return tree
+
+# Node handlers for the dispatch table below. Each takes the node and the
+# recursive evaluator, so type(node) indexes straight to the right handler
+# instead of walking an isinstance chain per node.
+def _eval_constant(node, _eval):
+    if isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError("Only numeric constants allowed")
+
+def _eval_binop(node, _eval):
+    left = _eval(node.left)
+    right = _eval(node.right)
+    op_type = type(node.op)
+    if op_type in ALLOWED_OPERATORS:
+        return ALLOWED_OPERATORS[op_type](left, right)
+    raise ValueError(f"Operator {op_type} not allowed")
+
+def _eval_unaryop(node, _eval):
+    operand = _eval(node.operand)
+    op_type = type(node.op)
+    if op_type in ALLOWED_OPERATORS:
+        return ALLOWED_OPERATORS[op_type](operand)
+    raise ValueError(f"Unary operator {op_type} not allowed")
+
+def _reject_call(node, _eval):
+    raise ValueError("Function calls are not allowed")
+
+_DISPATCH = {
+    ast.Expression: lambda node, _eval: _eval(node.body),
+    ast.Constant: _eval_constant,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+    ast.Call: _reject_call,
+}
+
+def _eval(node):
+    try:
+        handler = _DISPATCH[type(node)]
+    except KeyError:
+        # Any other node is rejected
+        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+    return handler(node, _eval)
+
 def safe_eval(expr: str):
     """
     Safely evaluate a numeric expression using ast.
     Supports + - * / % ** and parentheses, unary +/-. Raises ValueError
     for anything else.
     """
+    # Fast path: pure numeric literals (e.g. "42", "-3.14") short-circuit the
+    # whole parse/walk pipeline.
     try:
-        parsed = ast.parse(expr, mode='eval')
+        value = ast.literal_eval(expr)
+    except Exception:
+        pass
+    else:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+
+    try:
+        parsed = _parse(expr)
     except Exception as e:
         raise ValueError(f"Invalid expression: {e}")
 
-    def _eval(node):
-        if isinstance(node, ast.Expression):
-            return _eval(node.body)
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            if isinstance(node.value, (int, float)):
-                return node.value
-            else:
-                raise ValueError("Only numeric constants allowed")
-        if isinstance(node, ast.Num):  # for older ast
-            return node.n
-        if isinstance(node, ast.BinOp):
-            left = _eval(node.left)
-            right = _eval(node.right)
-            op_type = type(node.op)
-            if op_type in ALLOWED_OPERATORS:
-                return ALLOWED_OPERATORS[op_type](left, right)
-            else:
-                raise ValueError(f"Operator {op_type} not allowed")
-        if isinstance(node, ast.UnaryOp):
-            operand = _eval(node.operand)
-            op_type = type(node.op)
-            if op_type in ALLOWED_OPERATORS:
-                return ALLOWED_OPERATORS[op_type](operand)
-            else:
-                raise ValueError(f"Unary operator {op_type} not allowed")
-        if isinstance(node, ast.Call):
-            raise ValueError("Function calls are not allowed")
-        # Any other node is rejected
-        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+    return _eval(parsed)
+
+def _history_key(history):
+    """Hashable snapshot of the history, used as the cache key below. The
+    cached functions take the content itself rather than reading session
+    state, so the process-global cache can never leak entries between
+    sessions that happen to share a length and timestamp."""
+    return tuple((e["expression"], e["result"], e["time"]) for e in history)
+
+# Serialized lazily: this only runs once the user has asked to download, and
+# an unchanged history reuses the previous JSON string instead of
+# re-serializing on every rerun.
+@st.cache_data(max_entries=8, show_spinner=False)
+def _history_json(entries):
+    return json.dumps(
+        [{"expression": x, "result": r, "time": t} for x, r, t in entries],
+        indent=2)
 
-    result = _eval(parsed)
-    return result
+# One dataframe render instead of one st.write per history entry; keyed on
+# the same content snapshot so an unchanged history skips reconstruction.
+@st.cache_data(max_entries=8, show_spinner=False)
+def _history_df(entries):
+    return pd.DataFrame(list(entries), columns=["expression", "result", "time"])
 
 # ---------- Streamlit UI ----------
 st.set_page_config(page_title="Simple Calculator", layout="centered")
@@ -74,33 +159,34 @@ st.set_page_config(page_title="Simple Calculator", layout="centered")
 st.title("🧮 Simple Calculator (Safe Evaluation)")
 st.write("Enter a numeric expression (e.g. `1+2*3`, `(4-1)/3`, `2**8`) and press **Calculate**.")
 
-# Input area
-expr = st.text_input("Expression", value="", placeholder="e.g. 12 + 3 * (4 - 1)")
+# Input area: a form so typing into the box doesn't rerun the script —
+# only the Calculate submit does.
+with st.form("calc", clear_on_submit=False):
+    expr = st.text_input("Expression", value="", placeholder="e.g. 12 + 3 * (4 - 1)")
+    submitted = st.form_submit_button("Calculate")
 
-col1, col2 = st.columns([1, 1])
-with col1:
-    if st.button("Calculate"):
-        if expr.strip() == "":
-            st.warning("Please enter an expression.")
-        else:
-            try:
-                result = safe_eval(expr)
-                st.success(f"Result: `{result}`")
-                # store history
-                if "history" not in st.session_state:
-                    st.session_state.history = []
-                st.session_state.history.insert(0, {
-                    "expression": expr,
-                    "result": result,
-                    "time": datetime.now().isoformat(timespec='seconds')
-                })
-            except Exception as e:
-                st.error(f"Error: {e}")
-
-with col2:
-    if st.button("Clear history"):
-        st.session_state.history = []
-        st.experimental_rerun()
+if submitted:
+    if expr.strip() == "":
+        st.warning("Please enter an expression.")
+    else:
+        try:
+            result = safe_eval(expr)
+            st.success(f"Result: `{result}`")
+            # store history (deque: O(1) appendleft + automatic cap)
+            if "history" not in st.session_state:
+                st.session_state.history = collections.deque(maxlen=200)
+            st.session_state.history.appendleft({
+                "expression": expr,
+                "result": result,
+                "time": datetime.now().isoformat(timespec='seconds')
+            })
+        except Exception as e:
+            st.error(f"Error: {e}")
+
+# No forced rerun needed: the history section renders later in this same
+# script run, so the cleared state is already visible.
+if st.button("Clear history"):
+    st.session_state.history = collections.deque(maxlen=200)
 
 # Quick operator buttons
 st.markdown("**Quick operators**")
@@ -121,13 +207,12 @@ st.caption("Tip: you can build expressions using the input box; quick operator b
 st.markdown("### History")
 history = st.session_state.get("history", [])
 if history:
-    for i, item in enumerate(history):
-        st.write(f"{i+1}. `{item['expression']}` = **{item['result']}**  —  _{item['time']}_")
+    st.dataframe(_history_df(_history_key(history)), use_container_width=True)
     # provide download of history
     if st.button("Download history (JSON)"):
         st.download_button(
             label="Download",
-            data=json.dumps(history, indent=2),
+            data=_history_json(_history_key(history)),
             file_name="calc_history.json",
             mime="application/json"
         )
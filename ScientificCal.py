@@ -1 +1,5 @@
+# Thin page shim: all evaluation and UI live in calc_core, which is imported
+# once per process instead of being re-parsed on every Streamlit rerun.
+from calc_core import render
 
+render()
@@ -0,0 +1,365 @@
+# calc_core.py
+"""
+Shared expression-evaluation core for the calculator apps.
+
+Living in an imported module (rather than a page script) matters for
+performance: Streamlit re-executes page scripts on every rerun, but this
+module is imported once per process, so the lru_cache below actually
+persists across button presses.
+"""
+
+import ast
+import functools
+import math
+
+import streamlit as st
+
+# Globals passed to eval(); frozen once so each call shares the same dict.
+_GLOBALS = {"__builtins__": None}
+
+# Single-char display glyphs -> Python operators, as one translate table
+# instead of chained .replace() calls (one pass, no intermediate strings).
+_TRANS = str.maketrans({"÷": "/", "×": "*", "−": "-"})
+
+# Memoized shims for the expensive integer-domain functions: repeated calls
+# with the same argument become dict lookups instead of bignum arithmetic.
+_factorial = functools.lru_cache(maxsize=2048)(math.factorial)
+_gamma = functools.lru_cache(maxsize=1024)(math.gamma)
+
+# Locals/Globals allowed during eval: math, pi, e, abs, round.
+# Built once at import instead of on every safe_eval call.
+_SAFE_SCOPE = {
+    "math": math,
+    "pi": math.pi,
+    "e": math.e,
+    "abs": abs,
+    "round": round,
+    "factorial": _factorial,
+    "fact": _factorial,
+    "gamma": _gamma
+}
+
+# Fixed allowlist of bare math names (no "math." prefix needed in typed
+# input). A hardcoded tuple rather than a dir(math) scan keeps the scope
+# small and its contents explicit.
+_ALLOWED_NAMES = ("sin", "cos", "tan", "sqrt", "log", "exp", "pow",
+                  "floor", "ceil", "pi", "e")
+_SAFE_SCOPE.update({n: getattr(math, n) for n in _ALLOWED_NAMES if n not in _SAFE_SCOPE})
+
+# Node types the validator accepts; anything else is rejected before compile.
+_ALLOWED_NODE_TYPES = frozenset({
+    ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp, ast.Call,
+    ast.Name, ast.Attribute, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+})
+
+def _validate(tree):
+    """One ast.walk pass rejecting anything outside the whitelist up front."""
+    for node in ast.walk(tree):
+        if type(node) not in _ALLOWED_NODE_TYPES:
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+        if isinstance(node, ast.Attribute):
+            # Only math.<name>, and never dunder/private attrs
+            # (blocks sandbox escapes like (1).__class__).
+            if (not isinstance(node.value, ast.Name)
+                    or node.value.id != "math"
+                    or node.attr.startswith("_")):
+                raise ValueError("Only math.* attributes are allowed")
+        elif isinstance(node, ast.Name) and node.id not in _SAFE_SCOPE:
+            raise ValueError(f"Unknown name: {node.id}")
+
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr):
+    """Validate, then compile an expression once; repeat presses reuse the
+    known-safe code object and run it through CPython's own bytecode loop."""
+    tree = ast.parse(expr, mode="eval")
+    _validate(tree)
+    return compile(tree, "<calc>", "eval")
+
+# Result memoization on top of the compile cache: a repeated '=' press on the
+# same expression is an O(1) cache hit, skipping even the eval of the cached
+# code object. Pure function of expr, so keying on the string is sound.
+@st.cache_data(max_entries=256, show_spinner=False)
+def safe_eval(expr):
+    """Safely evaluates the expression using a limited set of allowed functions
+    and modules. Returns a (display string, numeric value) pair; the value is
+    None on error so callers can chain calculations without re-parsing."""
+
+    # Pre-process expression string
+    expr = expr.translate(_TRANS)  # ÷ × − from typed/display input
+    expr = expr.replace("^", "**") # Standard power operator (multi-char output)
+
+    # Fast path: pure numeric literals skip parse/validate/compile entirely.
+    try:
+        lit = ast.literal_eval(expr)
+    except Exception:
+        pass
+    else:
+        if isinstance(lit, (int, float)) and not isinstance(lit, bool):
+            return f"{lit:.10g}", lit
+
+    try:
+        # Use a safe environment (no __builtins__) and a cached code object
+        result = eval(_compile_expr(expr), _GLOBALS, _SAFE_SCOPE)
+        # Format complex numbers nicely if they result
+        if isinstance(result, complex):
+            display = f"{result.real:.10g} + {result.imag:.10g}i" if result.imag != 0 else f"{result.real:.10g}"
+        else:
+            display = f"{result:.10g}" # Format to 10 significant digits
+        return display, result
+    except Exception as e:
+        # Catch common errors like ZeroDivisionError, SyntaxError, etc.
+        return "Error", None
+
+# ---------- BUTTON GRID CONFIGURATION ----------
+# Import-cached: page scripts are re-executed per rerun, so keeping these
+# literals there meant re-allocating them on every button press.
+BUTTONS = [
+    ["AC", "C", "^", "%", "abs("],
+    ["7", "8", "9", "÷", "math.sin("],
+    ["4", "5", "6", "×", "math.cos("],
+    ["1", "2", "3", "−", "math.tan("],
+    ["0", ".", "(", ")", "+"],
+    ["math.sqrt(", "math.log(", "math.pi", "math.e", "="]
+]
+
+# Mapping display symbols to internal string values for evaluation
+MAPPING = {
+    "÷": "/",
+    "×": "*",
+    "−": "-",
+    "√": "math.sqrt(", # Not needed since we use math.sqrt( in the list
+    "^": "^",
+    "math.sin(": "math.sin(",
+    "math.cos(": "math.cos(",
+    "math.tan(": "math.tan(",
+    "math.sqrt(": "math.sqrt(",
+    "math.log(": "math.log(",
+    "abs(": "abs(",
+    "round(": "round(",
+    "math.pi": "math.pi",
+    "math.e": "math.e",
+}
+
+# Precomputed (display label, expression token) pairs so the rerun loop does
+# no per-button string replacement or mapping lookups.
+GRID = [
+    [(label.replace("math.", "").replace("(", "").replace("sqrt", "√").replace("pi", "π"),
+      MAPPING.get(label, label))
+     for label in row]
+    for row in BUTTONS
+]
+
+# ---------- STYLE (loaded once) ----------
+# Custom CSS for Casio-style look and responsive layout. Served from a
+# cache_resource function so the markup is built once per process.
+# (It must still be emitted every rerun: Streamlit drops elements that are
+# skipped on a rerun, so gating behind a session flag would lose the styling.)
+@st.cache_resource(show_spinner=False)
+def _css():
+    return """
+<style>
+div[data-testid="stAppViewContainer"] {
+    background-color: #0f0f0f;
+}
+h1, p {
+    color: #fff;
+    text-align: center;
+}
+/* Main calculator body (responsive styling) */
+.calculator {
+    background-color: #1a1a1a;
+    border-radius: 15px;
+    padding: 20px;
+    /* Fixed width for desktop, full width for mobile */
+    max-width: 400px;
+    width: 95%;
+    margin: auto;
+    box-shadow: 0px 0px 15px rgba(0,255,255,0.4);
+}
+/* Display for the current expression (green text on black background) */
+.display {
+    background-color: #000;
+    color: #00ffcc;
+    font-family: 'Courier New', monospace; /* Classic calculator font */
+    font-size: 24px;
+    text-align: right;
+    border-radius: 10px;
+    padding: 10px 15px;
+    border: 2px solid #00ffcc;
+    height: 45px;
+    overflow-x: auto;
+    white-space: nowrap; /* Ensures expression stays on one line */
+    margin-bottom: 8px;
+}
+/* Display for the result */
+.result-display {
+    background-color: #111;
+    color: #00ffcc;
+    font-family: 'Courier New', monospace;
+    font-size: 20px;
+    font-weight: bold;
+    text-align: right;
+    border-radius: 10px;
+    padding: 6px 15px;
+    border: 1px solid #00ffcc;
+    margin-bottom: 12px;
+    height: 35px;
+    overflow-x: auto;
+    white-space: nowrap;
+}
+/* Streamlit button customization (NOW WHITE BACKGROUND, BLACK TEXT) */
+div[data-testid="stColumn"] button {
+    background-color: #ffffff; /* White background */
+    color: #000000; /* Black text */
+    border: 1px solid #888;
+    border-radius: 8px;
+    transition: background-color 0.2s, box-shadow 0.2s;
+}
+div[data-testid="stColumn"] button:hover {
+    background-color: #eee; /* Light gray on hover */
+    box-shadow: 0px 0px 5px rgba(0,0,0,0.1);
+}
+/* Specific style for operators and functions (Keeping distinct Casio colors).
+   Targeted via the stable .st-key-<widget key> classes instead of nth-child,
+   so no extra wrapper markdown is needed per button. */
+.st-key-btn_0_0 button, .st-key-btn_0_3 button, .st-key-btn_0_4 button,
+.st-key-btn_1_3 button, .st-key-btn_1_4 button,
+.st-key-btn_2_3 button, .st-key-btn_2_4 button,
+.st-key-btn_3_3 button, .st-key-btn_3_4 button,
+.st-key-btn_4_3 button, .st-key-btn_4_4 button,
+.st-key-btn_5_3 button {
+    background-color: #c9513e;
+    color: #fff;
+}
+.st-key-btn_5_4 button { /* = button */
+    background-color: #00ffcc;
+    color: #1a1a1a;
+    font-weight: bold !important;
+}
+
+/* Hide Streamlit footer and deploy button */
+footer, .stDeployButton {visibility: hidden;}
+</style>
+"""
+
+# --- BUTTON LOGIC ---
+def _expr():
+    """Current expression string, assembled from the token buffer on demand."""
+    return "".join(st.session_state.expr_buf)
+
+def press(key):
+    """Handles button presses and updates the session state token buffer.
+
+    The expression lives as a list of tokens: appending a key and undoing a
+    backspace are O(1) list operations instead of reallocating an immutable
+    string copy per press.
+    """
+
+    # Clear result display on any input if it was an error or a final result
+    if st.session_state.result in ["Error"] or (st.session_state.result and key not in ["="]):
+        # If the key is a number or operator, and the result is present, start a new expression
+        if key.isdigit() or key in ["(", "math.pi", "math.e", "/"]:
+            st.session_state.expr_buf = []
+        elif key in ["+", "-", "*", "^", "%"] and st.session_state.result_value is not None:
+            # Chain from the numeric answer: the next '=' parses a short
+            # literal instead of the whole previous expression.
+            st.session_state.expr_buf = [repr(st.session_state.result_value)]
+        st.session_state.result = ""
+        st.session_state.result_value = None
+
+    if key == "=":
+        display, value = safe_eval(_expr())
+        st.session_state.result = display
+        st.session_state.result_value = value
+    elif key == "C":  # Backspace: drop the last token in O(1)
+        if st.session_state.expr_buf:
+            st.session_state.expr_buf.pop()
+    elif key == "AC":
+        st.session_state.expr_buf = []
+        st.session_state.result = ""
+        st.session_state.result_value = None
+    else:
+        # All other keys (numbers, operators, parentheses, functions,
+        # constants) are appended as-is — they already carry their own
+        # opening parenthesis or math. prefix where needed.
+        st.session_state.expr_buf.append(key)
+
+# Cached interpolation for the display divs: an unchanged expr/result reuses
+# the same string object across reruns instead of rebuilding the f-string,
+# which also lets Streamlit's delta diffing see identical payloads.
+@functools.lru_cache(maxsize=256)
+def _display_html(expr):
+    return f'<div class="display">{expr or "0"}</div>'
+
+@functools.lru_cache(maxsize=256)
+def _result_html(result):
+    return f'<div class="result-display">{result}</div>'
+
+# --- CALCULATOR BODY ---
+# A fragment so keypad interactions rerun only this function, not the whole
+# script (page config, CSS, title and the typed-input form stay untouched).
+@st.fragment
+def _calculator():
+    st.html('<div class="calculator">')
+    # Display current expression
+    st.html(_display_html(_expr()))
+    # Display result
+    st.html(_result_html(st.session_state.result))
+
+    # --- BUTTON GRID GENERATION ---
+    # One st.columns call reused for every row: buttons stack inside the five
+    # column containers, so the rerun emits one column Delta instead of six.
+    cols = st.columns(5)
+    for r, row in enumerate(GRID):
+        for i, (display_label, key_to_press) in enumerate(row):
+            with cols[i]:
+                # on_click runs before the rerun renders, so the display is
+                # fresh in the same cycle — no explicit st.rerun() needed.
+                st.button(display_label, use_container_width=True,
+                          key=f"btn_{r}_{i}", on_click=press, args=(key_to_press,))
+
+    st.html('</div>')
+
+# ---------- INITIAL STATE ----------
+def _init_state():
+    """Seed all calculator fields behind a single membership check.
+
+    Deliberately session_state rather than a cache_resource singleton:
+    cache_resource is process-wide, so a shared container would leak one
+    user's expression into every other session.
+    """
+    if "expr_buf" not in st.session_state:
+        st.session_state.update(
+            expr_buf=[],        # expression as a token list; joined on demand
+            result="",
+            result_value=None,  # numeric twin of the display string
+        )
+
+def render():
+    """Entry point for the calculator pages; the page scripts are thin shims."""
+    st.set_page_config(page_title="Scientific Calculator", page_icon="🧮", layout="centered")
+
+    _init_state()
+
+    st.html(_css())
+
+    st.title("🧮 Casio-Style Scientific Calculator")
+
+    # --- TYPED INPUT ---
+    # A form batches free-form typing into a single rerun on submit, instead of
+    # one full rerun per keypad press when building long expressions. Placed
+    # before the display so the submitted result renders in the same rerun.
+    with st.form("typed_expr", clear_on_submit=False):
+        typed = st.text_input("Type an expression", value=_expr(),
+                              placeholder="e.g. math.sin(0.5) + 2^3")
+        if st.form_submit_button("Evaluate"):
+            st.session_state.expr_buf = [typed] if typed else []
+            display, value = safe_eval(typed)
+            st.session_state.result = display
+            st.session_state.result_value = value
+
+    _calculator()
+
+    st.html("<br><center><p style='color:#888;'>Casio fx-991EX inspired calculator built with ❤️ using Streamlit</p></center>")